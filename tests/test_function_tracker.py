@@ -0,0 +1,94 @@
+import unittest
+from types import SimpleNamespace
+from variable_tracker.function_tracker import FunctionTracker, _extract_class_vars
+from variable_tracker.models import SettingsData
+
+
+class TestFunctionTracker(unittest.TestCase):
+
+    def setUp(self):
+        self.settings = SettingsData(
+            module_path="python",
+            track_functions={"func": "*"},
+            track_classes={},
+            print_table=False,
+            print_lifecycle=True
+        )
+        self.function_tracker = FunctionTracker(self.settings)
+
+    def _sample(self, **f_locals):
+        frame = SimpleNamespace(f_locals=f_locals)
+        self.function_tracker._trace_function_variables(frame, "func", None)
+        return self.function_tracker.variable_lifecycle["func"]
+
+    def test_unchanged_container_is_not_recorded_again(self):
+        items = [1, 2]
+        self._sample(items=items)
+        lifecycle = self._sample(items=items)
+        self.assertEqual([change_type for change_type, _ in lifecycle["items"]], ["Initialized"])
+
+    def test_container_modified_in_place_is_recorded(self):
+        items = [1, 2]
+        self._sample(items=items)
+        items.append(3)
+        lifecycle = self._sample(items=items)
+        self.assertEqual(list(lifecycle["items"]), [("Initialized", [1, 2]), ("Changed", [1, 2, 3])])
+
+    def test_same_length_change_in_place_is_recorded(self):
+        items = [1, 2]
+        self._sample(items=items)
+        items[0] = 9
+        lifecycle = self._sample(items=items)
+        self.assertEqual(list(lifecycle["items"]), [("Initialized", [1, 2]), ("Changed", [9, 2])])
+        self.assertEqual(self.function_tracker.variable_changes["func"]["value"], [[1, 2], [9, 2]])
+
+    def test_rebinding_to_equal_value_is_not_recorded(self):
+        self._sample(items=[1, 2], total=10)
+        lifecycle = self._sample(items=[1, 2], total=11)
+        self.assertEqual(len(lifecycle["items"]), 1)
+        self.assertEqual(list(lifecycle["total"]), [("Initialized", 10), ("Changed", 11)])
+
+    def test_invalid_variable_selection_is_logged_not_raised(self):
+        self.settings.track_functions = {"func": None, "other": 3, "kept": ["total"]}
+        with self.assertLogs("variable_tracker.function_tracker", "WARNING") as logs:
+            self.function_tracker = FunctionTracker(self.settings)
+        self.assertEqual(len(logs.records), 2)
+        lifecycle = self._sample(total=1)
+        self.assertEqual(list(lifecycle), [])
+
+    def test_only_selected_variables_are_tracked(self):
+        self.settings.track_functions = {"func": ["total"]}
+        self.function_tracker = FunctionTracker(self.settings)
+        lifecycle = self._sample(total=1, other=2)
+        self.assertEqual(list(lifecycle), ["total"])
+
+    def test_lifecycle_is_bounded_by_max_history(self):
+        self.settings.max_history = 2
+        self.function_tracker = FunctionTracker(self.settings)
+        for total in range(5):
+            lifecycle = self._sample(total=total)
+        self.assertEqual(list(lifecycle["total"]), [("Changed", 3), ("Changed", 4)])
+
+    def test_instance_attributes_are_snapshotted(self):
+        # Iterating the live __dict__ would fail if another thread set an attribute
+        obj = SimpleNamespace(count=1)
+        class_vars = _extract_class_vars(obj)
+        obj.other = 2
+        self.assertEqual(class_vars, {"count": 1})
+
+    def test_slotted_instance_attributes_are_tracked(self):
+        class Slotted:
+            __slots__ = ("count", "unset")
+
+            def __init__(self):
+                self.count = 3
+
+        frame = SimpleNamespace(f_locals={"self": Slotted()})
+        self.function_tracker._trace_function_variables(frame, "func", "Slotted")
+        lifecycle = self.function_tracker.variable_lifecycle["func"]
+        self.assertEqual(list(lifecycle["count"]), [("Initialized", 3)])
+        self.assertNotIn("unset", lifecycle)
+
+
+if __name__ == "__main__":
+    unittest.main()
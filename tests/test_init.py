@@ -1,4 +1,5 @@
 import unittest
+from unittest.mock import patch
 from variable_tracker import Setup
 
 
@@ -8,6 +9,28 @@ class TestSetupImport(unittest.TestCase):
         self.assertIsInstance(Setup, type)
         # Further tests can be added based on the behavior of Setup
 
+    @patch("variable_tracker.main.Tracker")
+    def test_overlapping_starts_share_one_tracker(self, tracker_class):
+        # Test that the tracker is stopped only by the last matching stop()
+        setup = Setup("settings.json")
+        with patch.object(setup.settings_loader, "load_settings", return_value={}), \
+                patch("variable_tracker.main.FunctionTracker"), \
+                patch("variable_tracker.main.get_printer"):
+            setup.start()
+            setup.start()
+        tracker_class.assert_called_once()
+        tracker = tracker_class.return_value
+        tracker.start.assert_called_once_with()
+
+        setup.stop()
+        tracker.stop.assert_not_called()
+        setup.stop()
+        tracker.stop.assert_called_once_with()
+        self.assertIsNone(setup.tracker)
+        # Unmatched stops are ignored
+        setup.stop()
+        tracker.stop.assert_called_once_with()
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -1,7 +1,9 @@
 import unittest
 from unittest.mock import patch, mock_open
 import json
-from variable_tracker.settings_loader import JsonSettingsLoader
+import os
+import tempfile
+from variable_tracker.settings_loader import JsonSettingsLoader, _load_cached
 from variable_tracker.models import SettingsData
 
 
@@ -35,13 +37,28 @@ class TestJsonSettingsLoader(unittest.TestCase):
         self.assertEqual(settings_data.track_classes, {})
         self.assertFalse(settings_data.print_table)
         self.assertTrue(settings_data.print_lifecycle)
+        self.assertEqual(settings_data.max_history, 1024)
+        self.assertFalse(settings_data.trace_generators)
+
+    def test_invalid_max_history_falls_back_to_default(self):
+        loader = JsonSettingsLoader("config/settings.json")
+        for value in (0, -5, 2.5, "10", True, [10]):
+            with self.subTest(max_history=value):
+                data = loader._validate_settings({"max_history": value})
+                self.assertEqual(data["max_history"], 1024)
+        for value in (None, 1, 50):
+            with self.subTest(max_history=value):
+                data = loader._validate_settings({"max_history": value})
+                self.assertEqual(data["max_history"], value)
 
     @patch("builtins.open", mock_open())
-    @patch("json.load", side_effect=json.JSONDecodeError("Error", "", 0))
+    @patch("variable_tracker.settings_loader._json.loads", side_effect=json.JSONDecodeError("Error", "", 0))
     def test_load_settings_json_decode_error(self, mock_json):
         loader = JsonSettingsLoader("config/settings.json")
         settings_data = loader.load_settings()
 
+        mock_json.assert_called_once()
+
         self.assertEqual(settings_data.module_path, "python")  # Default setting is used
         self.assertEqual(settings_data.track_functions, {})
         self.assertEqual(settings_data.track_classes, {})
@@ -59,6 +76,29 @@ class TestJsonSettingsLoader(unittest.TestCase):
         self.assertFalse(settings_data.print_table)
         self.assertTrue(settings_data.print_lifecycle)
 
+    def test_load_settings_cached_until_file_changes(self):
+        _load_cached.cache_clear()
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = os.path.join(tmp_dir, "settings.json")
+            with open(path, "w") as f:
+                json.dump({"module_path": "first", "track_functions": {"func": "*"}}, f)
+
+            loader = JsonSettingsLoader(path)
+            self.assertEqual(loader.load_settings().module_path, "first")
+
+            # Unchanged file is served from the cache without re-opening it
+            with patch("builtins.open", side_effect=AssertionError("file re-read")):
+                self.assertEqual(loader.load_settings().module_path, "first")
+
+            # Changes to loaded settings don't leak into the cached parse
+            first = loader.load_settings()
+            first.track_functions["changed"] = "*"
+            self.assertEqual(loader.load_settings().track_functions, {"func": "*"})
+
+            with open(path, "w") as f:
+                json.dump({"module_path": "second-value"}, f)
+            self.assertEqual(loader.load_settings().module_path, "second-value")
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -1,6 +1,11 @@
+import cProfile
+import json
+import pstats
+import sys
+import threading
 import unittest
 from unittest.mock import MagicMock, patch
-from variable_tracker.tracker import Tracker
+from variable_tracker.tracker import Tracker, _TRACKED
 from variable_tracker.models import SettingsData
 from variable_tracker.function_tracker import FunctionTracker
 from variable_tracker.printer import PrinterAbstract
@@ -8,8 +13,22 @@ from variable_tracker.printer import PrinterAbstract
 
 class TestTracker(unittest.TestCase):
 
+    @classmethod
+    def setUpClass(cls):
+        # Create the mocked Tracker components once; MagicMock construction
+        # is costly and the tests only reset their recorded calls
+        cls.function_tracker = MagicMock(FunctionTracker)
+        cls.printer = MagicMock(PrinterAbstract)
+
     def setUp(self):
-        # Set up mock SettingsData and Tracker components
+        # Clear calls recorded by previous tests
+        self.function_tracker.reset_mock()
+        self.printer.reset_mock()
+
+        # Mocking variable_lifecycle attribute for the FunctionTracker
+        self.function_tracker.variable_lifecycle = {}
+
+        # Set up mock SettingsData and a fresh Tracker, whose caches start empty
         self.settings = SettingsData(
             module_path="python",
             track_functions={},
@@ -17,14 +36,17 @@ class TestTracker(unittest.TestCase):
             print_table=False,
             print_lifecycle=True
         )
-        self.function_tracker = MagicMock(FunctionTracker)
-        self.printer = MagicMock(PrinterAbstract)
-
-        # Create an instance of Tracker with the mocks
         self.tracker = Tracker(self.settings, self.function_tracker, self.printer)
 
-        # Mocking variable_lifecycle attribute for the FunctionTracker
-        self.function_tracker.variable_lifecycle = []
+    def _frame(self):
+        # A frame of a plain function inside the module path, which no skip path matches
+        frame = MagicMock()
+        frame.f_code.co_filename = "/app/python/views.py"
+        frame.f_code.co_name = "view"
+        frame.f_code.co_flags = 0
+        frame.f_globals = {"__name__": "views"}
+        frame.f_locals = {}
+        return frame
 
     def test_get_class_name_inside_class(self):
         # Test if inside a class, the method returns class name
@@ -40,6 +62,189 @@ class TestTracker(unittest.TestCase):
         result = self.tracker._get_class_name(frame)
         self.assertIsNone(result)
 
+    def test_get_code_info_is_cached_per_code_object(self):
+        # Test that a code object is only classified once
+        frame = sys._getframe()
+        with patch.object(self.tracker, "_should_skip_frame", return_value=False) as should_skip:
+            first = self.tracker._get_code_info(frame)
+            second = self.tracker._get_code_info(frame)
+
+        self.assertIs(first, second)
+        self.assertEqual(first, (_TRACKED, "test_tracker", __name__, "test_get_code_info_is_cached_per_code_object", {}))
+        should_skip.assert_called_once()
+
+    def test_code_cache_is_dropped_with_its_code_object(self):
+        # Test that classifications neither outlive their code object nor
+        # register anything that outlives the tracker
+        frame = MagicMock()
+        frame.f_code = compile("pass", "<test>", "exec")
+        frame.f_globals = {}
+        code_id = id(frame.f_code)
+
+        with patch("weakref.finalize") as finalize:
+            self.tracker._get_code_info(frame)
+        self.assertIn(code_id, self.tracker._code_cache)
+        finalize.assert_not_called()
+
+        del frame.f_code
+        self.assertNotIn(code_id, self.tracker._code_cache)
+
+    def test_full_name_is_resolved_once_per_code_object_and_class(self):
+        # Test that the tracking key is cached with the code object's classification
+        frame = self._frame()
+        self.tracker._trace_calls(frame, "call", None)
+        self.tracker._trace_calls(frame, "line", None)
+        self.function_tracker._get_function_full_name.assert_called_once_with(
+            "views", "views", "view", None
+        )
+
+    def test_generator_code_is_skipped(self):
+        # Test that generator frames are skipped unless trace_generators is set
+        def generator():
+            yield sys._getframe()
+
+        frame = next(generator())
+        with patch.object(self.tracker, "_should_skip_frame", return_value=False):
+            info = self.tracker._get_code_info(frame)
+
+        self.assertNotEqual(info[0], _TRACKED)
+
+    def test_tracking_errors_are_logged_once_per_function(self):
+        # Test that a repeatedly failing function only logs its first error
+        with self.assertLogs("variable_tracker.tracker", level="WARNING") as logs:
+            self.tracker._report_error("full_func_name", TypeError("boom"))
+            self.tracker._report_error("full_func_name", TypeError("boom"))
+
+        self.assertEqual(len(logs.records), 1)
+
+    def test_values_changed_within_a_function_are_recorded(self):
+        # Test that every value a variable takes inside a tracked function is recorded
+        settings = SettingsData(module_path="test_tracker", track_functions={"steps": "*"})
+        printer = MagicMock(PrinterAbstract)
+        printed = {}
+        printer.print.side_effect = lambda data, name: printed.update(data[name])
+        tracker = Tracker(settings, FunctionTracker(settings), printer)
+
+        def steps():
+            a = 1
+            a = 2
+            a = 3
+            return a
+
+        tracker.start()
+        try:
+            steps()
+        finally:
+            tracker.stop()
+
+        self.assertEqual(list(printed["a"]), [("Initialized", 1), ("Changed", 2), ("Changed", 3)])
+
+    def test_traced_generators_are_printed_at_every_yield(self):
+        # Test that both tracing backends print a traced generator at each yield
+        settings = SettingsData(module_path="test_tracker", track_functions={"gen": "*"},
+                                trace_generators=True)
+        printer = MagicMock(PrinterAbstract)
+        printed = []
+        printer.print.side_effect = lambda data, name: printed.append(list(data[name].get("a", ())))
+        tracker = Tracker(settings, FunctionTracker(settings), printer)
+
+        def gen():
+            a = 1
+            yield a
+            a = 2
+            yield a
+
+        tracker.start()
+        try:
+            list(gen())
+        finally:
+            tracker.stop()
+
+        self.assertEqual(printed, [
+            [("Initialized", 1)],
+            [("Initialized", 1), ("Changed", 2)],
+            [("Initialized", 2)],
+        ])
+
+    def test_errors_from_tracked_values_do_not_reach_the_program(self):
+        # Test that an error raised by a tracked value is logged, not propagated
+        class Fragile(list):
+            def __ne__(self, other):
+                raise RuntimeError("boom")
+
+        settings = SettingsData(module_path="test_tracker", track_functions={"fragile": "*"})
+        tracker = Tracker(settings, FunctionTracker(settings), MagicMock(PrinterAbstract))
+
+        def fragile():
+            a = Fragile()
+            a = Fragile([1])
+            return len(a)
+
+        with self.assertLogs("variable_tracker.tracker", level="WARNING") as logs:
+            tracker.start()
+            try:
+                result = fragile()
+            finally:
+                tracker.stop()
+
+        self.assertEqual(result, 1)
+        self.assertEqual(len(logs.records), 1)
+
+    def test_threads_started_while_tracking_stop_with_the_tracker(self):
+        # Test that a thread started during tracking isn't tracked after stop()
+        settings = SettingsData(module_path="test_tracker", track_functions={"work": "*"})
+        printer = MagicMock(PrinterAbstract)
+        tracker = Tracker(settings, FunctionTracker(settings), printer)
+        resume = threading.Event()
+
+        def work():
+            a = 1
+            return a
+
+        def worker():
+            resume.wait()
+            work()
+
+        tracker.start()
+        try:
+            thread = threading.Thread(target=worker)
+            thread.start()
+        finally:
+            tracker.stop()
+        resume.set()
+        thread.join()
+
+        printer.print.assert_not_called()
+
+    def test_profilers_see_library_calls_after_the_tracker_stops(self):
+        # Test that the tracker leaves no disabled events behind for other tools
+        settings = SettingsData(module_path="test_tracker")
+        tracker = Tracker(settings, FunctionTracker(settings), MagicMock(PrinterAbstract))
+        tracker.start()
+        try:
+            json.dumps({"a": 1})
+        finally:
+            tracker.stop()
+
+        profiler = cProfile.Profile()
+        profiler.runcall(json.dumps, {"a": 1})
+        profiled = {name for _, _, name in pstats.Stats(profiler).stats}
+        self.assertIn("dumps", profiled)
+
+    def test_second_start_is_refused(self):
+        # Test that a running tracker can't be started again, which would
+        # leave the first hooks or tool id behind
+        self.tracker.start()
+        try:
+            with self.assertRaises(RuntimeError):
+                self.tracker.start()
+        finally:
+            self.tracker.stop()
+        # A stopped tracker can be started again
+        self.tracker.start()
+        self.tracker.stop()
+        self.tracker.stop()
+
     @patch.object(Tracker, '_trace_calls', return_value=None)
     def test_trace_calls(self, *args, **kwargs):
         # Test the _trace_calls method itself
@@ -53,7 +258,7 @@ class TestTracker(unittest.TestCase):
 
     def test_trace_calls_with_function(self):
         # Test that the tracker interacts correctly with function tracker and printer
-        frame = MagicMock()
+        frame = self._frame()
         event = "return"
         arg = None
 
@@ -1,15 +1,75 @@
-from abc import ABC, abstractmethod
-from typing import Dict, Any, Optional, List
-from .models import SettingsData
+import logging
+import sys
+from array import array
+from collections import deque
+from functools import lru_cache
+from itertools import chain
+from typing import Dict, Any, Optional, Deque, Iterator, FrozenSet, Union, Tuple, Protocol
+from .models import SettingsData, INITIALIZED, CHANGED, CHANGE_TYPES, WILDCARD
 
+logger = logging.getLogger(__name__)
 
-class FunctionTrackerAbstract(ABC):
+# Marks a declared slot that has no value on the instance
+_UNSET = object()
+
+
+@lru_cache(maxsize=256)
+def _slot_names(cls: type) -> Tuple[str, ...]:
+    """
+    Collect the instance attribute names declared in `__slots__` across a class's MRO.
+
+    Args:
+        cls: The class to inspect.
+
+    Returns:
+        The declared slot names, excluding `__dict__` and `__weakref__`.
+    """
+    names = []
+    for klass in cls.__mro__:
+        slots = klass.__dict__.get("__slots__", ())
+        if isinstance(slots, str):
+            slots = (slots,)
+        for name in slots:
+            if name not in ("__dict__", "__weakref__") and name not in names:
+                names.append(name)
+    return tuple(names)
+
+
+def _extract_class_vars(obj: Any) -> Dict[str, Any]:
+    """
+    Return the instance attributes of an object, including slotted ones.
+
+    The result is a snapshot: `__dict__` is copied in a single C-level call, so
+    another thread setting an attribute can't change it while it is iterated.
+
+    Args:
+        obj: The instance bound to `self`.
+
+    Returns:
+        A mapping of attribute names to values; empty if the object has none.
+    """
+    attributes = getattr(obj, "__dict__", None)
+    slot_names = _slot_names(type(obj))
+    if not slot_names:
+        return dict(attributes) if attributes else {}
+
+    class_vars = {}
+    for name in slot_names:
+        value = getattr(obj, name, _UNSET)
+        if value is not _UNSET:
+            class_vars[name] = value
+    if attributes:
+        class_vars.update(attributes)
+    return class_vars
+
+
+class FunctionTrackerAbstract(Protocol):
     """
-    Abstract base class for a function tracker, ensuring that all subclasses
-    implement the required methods for handling function tracking.
+    Protocol for a function tracker, describing the methods required for
+    handling function tracking. Conformance is structural, so implementations
+    don't need to inherit from this class.
     """
     
-    @abstractmethod
     def _get_function_full_name(self, module_name: str, file_name: str, 
                                 func_name: str, class_name: Optional[str]) -> str:
         """
@@ -24,15 +84,26 @@ class FunctionTrackerAbstract(ABC):
         Returns:
             The fully qualified name of the function or a matching tracking key.
         """
-        pass
+        ...
 
 
-class FunctionTracker(FunctionTrackerAbstract):
+class FunctionTracker:
     """
-    Concrete implementation of a function tracker that tracks function calls
-    and variable lifecycles based on provided settings.
+    Concrete implementation of a function tracker (FunctionTrackerAbstract
+    protocol) that tracks function calls and variable lifecycles based on
+    provided settings.
     """
 
+    # Value types whose changes are recorded
+    _TRACKABLE_TYPES = (
+        int, float, str, list, dict, tuple, set, complex, bool, bytes, bytearray, memoryview
+    )
+    # Exact-type lookup used before falling back to isinstance() for subclasses
+    _TRACKABLE_TYPE_SET = frozenset(_TRACKABLE_TYPES)
+    # Containers that can change in place; recorded as shallow copies so later
+    # changes to the same object are compared against the recorded contents
+    _MUTABLE_TYPES = (list, dict, set, bytearray)
+
     def __init__(self, settings: SettingsData):
         """
         Initialize the FunctionTracker with user-defined settings.
@@ -41,16 +112,67 @@ class FunctionTracker(FunctionTrackerAbstract):
             settings: An instance of SettingsData containing tracking configurations.
         """
         self.settings = settings
-        # To store the lifecycle of tracked variables per function
-        self.variable_lifecycle: Dict[str, Dict[str, List[tuple]]] = {}
-        # To store all changes to variables per function
-        self.variable_changes: Dict[str, Dict[str, List[tuple]]] = {}
+        # To store the lifecycle of tracked variables per function, keeping at
+        # most `settings.max_history` entries per variable
+        self.variable_lifecycle: Dict[str, Dict[str, Deque[tuple]]] = {}
+        # To store all changes to variables per function, as parallel columns:
+        # {"name": [var_name, ...], "type": array("B", [code, ...]), "value": [value, ...]}
+        self.variable_changes: Dict[str, Dict[str, Any]] = {}
+        # Configured variable selections, with each value either WILDCARD or a frozenset of names
+        self._function_targets = self._compile_targets(self.settings.track_functions)
+        self._class_targets = self._compile_targets(self.settings.track_classes)
+        # All configured function and class keys, probed by _get_function_full_name
+        self._tracked_keys = frozenset(self._function_targets) | frozenset(self._class_targets)
+        # Empty filters select everything they cover: without track_classes every
+        # variable of a method is tracked, and without either filter every method is
+        self._all_class_variables = not self.settings.track_classes
+        self._all_function_variables = not self.settings.track_functions
+        self._track_all_methods = self._all_class_variables and self._all_function_variables
+        # Cached _should_track_variable decisions per (full_func_name, class_name, var_name)
+        self._track_decision: Dict[tuple, bool] = {}
+
+    @staticmethod
+    def _compile_targets(targets: Any) -> Dict[str, Union[str, FrozenSet[str]]]:
+        """
+        Normalize a `track_functions` or `track_classes` setting for fast lookups.
+
+        Args:
+            targets: The configured mapping of keys to `"*"`, a variable name or a
+                list of variable names. A list of keys tracks all their variables.
+
+        Returns:
+            A dict mapping each key to WILDCARD or a frozenset of variable names.
+            A key whose value is not a list of names (such as null or a number)
+            is logged and tracks no variables.
+        """
+        if not isinstance(targets, dict):
+            return {key: WILDCARD for key in targets}
+
+        compiled = {}
+        for key, names in targets.items():
+            if names == WILDCARD:
+                compiled[key] = WILDCARD
+            elif isinstance(names, str):
+                compiled[key] = frozenset((names,))
+            else:
+                try:
+                    compiled[key] = frozenset(names)
+                except TypeError:
+                    logger.warning(
+                        "Ignoring the variables of '%s': expected \"*\", a name or a list "
+                        "of names, got %r", key, names
+                    )
+                    compiled[key] = frozenset()
+        return compiled
 
     def _get_function_full_name(self, module_name: str, file_name: str, 
                                 func_name: str, class_name: Optional[str]) -> str:
         """
         Generate the fully qualified function name or find a match for tracking.
 
+        The result only depends on the code object and the class name, so the
+        Tracker caches it with its per-code-object classification.
+
         Args:
             module_name: The name of the module containing the function.
             file_name: The name of the file containing the function.
@@ -60,25 +182,47 @@ class FunctionTracker(FunctionTrackerAbstract):
         Returns:
             A matching key for tracking or an empty string if no match is found.
         """
-        # Skip tracking if settings explicitly do not track classes or functions
-        if (class_name and not self.settings.track_classes) and not self.settings.track_functions:
+        # Without any filter configured every method is tracked under its own name
+        if class_name and self._track_all_methods:
             return func_name
 
-        # Generate all possible key variations for matching
-        possible_keys = {
-            f"{module_name}.{file_name}.{func_name}",
-            f"{module_name}.{file_name}.{class_name}.{func_name}",
-            f"{file_name}.{func_name}",
-            f"{file_name}.{class_name}.{func_name}",
-            f"{class_name}.{func_name}",
-            func_name,
-            class_name
-        }
-        # Find the intersection of possible keys with the configured tracking keys
-        matching_keys = possible_keys.intersection(set(self.settings.track_functions) | set(self.settings.track_classes))
+        # Nothing configured to match against
+        if not self._tracked_keys:
+            return ""
 
-        # Return the first match if any, otherwise return an empty string
-        return next(iter(matching_keys), "")
+        # Probe key variations lazily, cheapest first, and return the first match.
+        # The key is interned since it is used for dict lookups on every sample.
+        for key in self._candidate_keys(module_name, file_name, func_name, class_name):
+            if key in self._tracked_keys:
+                return sys.intern(key)
+
+        return ""
+
+    @staticmethod
+    def _candidate_keys(module_name: str, file_name: str,
+                        func_name: str, class_name: Optional[str]) -> Iterator[str]:
+        """
+        Yield the possible tracking keys of a function, cheapest to build first.
+
+        Args:
+            module_name: The name of the module containing the function.
+            file_name: The name of the file containing the function.
+            func_name: The name of the function.
+            class_name: The class name, if the function is a method.
+
+        Yields:
+            Key variations as they may appear in `track_functions` or `track_classes`.
+        """
+        yield func_name
+        if class_name:
+            yield class_name
+            yield f"{class_name}.{func_name}"
+        yield f"{file_name}.{func_name}"
+        if class_name:
+            yield f"{file_name}.{class_name}.{func_name}"
+        yield f"{module_name}.{file_name}.{func_name}"
+        if class_name:
+            yield f"{module_name}.{file_name}.{class_name}.{func_name}"
 
 
     def _trace_function_variables(self, frame: Any, full_func_name: str, class_name: Optional[str]) -> None:
@@ -94,42 +238,102 @@ class FunctionTracker(FunctionTrackerAbstract):
         locals_snapshot = frame.f_locals
 
         # Initialize storage for variable lifecycle and changes if not already present
-        if full_func_name not in self.variable_lifecycle:
-            self.variable_lifecycle[full_func_name] = {}
+        per_func_lifecycle = self.variable_lifecycle.get(full_func_name)
+        if per_func_lifecycle is None:
+            per_func_lifecycle = self.variable_lifecycle[full_func_name] = {}
 
         if full_func_name not in self.variable_changes:
-            self.variable_changes[full_func_name] = []
+            self.variable_changes[full_func_name] = {"name": [], "type": array("B"), "value": []}
+        changes = self.variable_changes[full_func_name]
 
         # Extract class-level variables if the function is a method
         class_vars = {}
         if class_name and "self" in locals_snapshot:
-            try:
-                class_vars = vars(locals_snapshot["self"])
-            except TypeError:
-                # Handle cases where `self` may not be a standard class-like object
-                pass
+            class_vars = _extract_class_vars(locals_snapshot["self"])
+
+        # Local and class-level variables to track; without attributes the locals
+        # are iterated as they are, so only methods with attributes pay for combining
+        variables_to_track = locals_snapshot.items()
+        if class_vars:
+            # Chain locals not shadowed by an attribute, then the attributes, so
+            # attributes take precedence over locals of the same name
+            variables_to_track = chain(
+                (item for item in variables_to_track if item[0] not in class_vars),
+                class_vars.items()
+            )
 
-        # Merge local and class-level variables for tracking
-        variables_to_track = {**locals_snapshot, **class_vars}
+        # Bind what the loop uses to locals; this runs for every variable of
+        # every sampled frame
+        should_track = self._should_track_variable
+        trackable_type_set = self._TRACKABLE_TYPE_SET
+        trackable_types = self._TRACKABLE_TYPES
+        mutable_types = self._MUTABLE_TYPES
+        append_name = changes["name"].append
+        append_type = changes["type"].append
+        append_value = changes["value"].append
+        max_history = self.settings.max_history
 
-        for var_name, value in variables_to_track.items():
+        for var_name, value in variables_to_track:
             # Check if the variable should be tracked
-            if self._should_track_variable(full_func_name, class_name, var_name) and isinstance(
-                value, (int, float, str, list, dict, tuple, set, complex, bool, bytes, bytearray, memoryview)
+            if should_track(full_func_name, class_name, var_name) and (
+                type(value) in trackable_type_set or isinstance(value, trackable_types)
             ):
                 # Track the lifecycle of the variable
-                var_lifecycle = self.variable_lifecycle[full_func_name].setdefault(var_name, [])
+                var_lifecycle = per_func_lifecycle.get(var_name)
+                if var_lifecycle is None:
+                    var_name = sys.intern(var_name)
+                    var_lifecycle = per_func_lifecycle[var_name] = deque(maxlen=max_history)
+
+                # Detect changes against the last recorded value; mutable values are
+                # recorded as copies, so an in-place change is compared by contents
+                if not var_lifecycle:
+                    changed = True
+                else:
+                    last_value = var_lifecycle[-1][1]
+                    changed = last_value is not value and last_value != value
 
                 # Log variable initialization or changes
-                if not var_lifecycle or var_lifecycle[-1][1] != value:
-                    change_type = "Initialized" if not var_lifecycle else "Changed"
-                    var_lifecycle.append((change_type, value))
-                    self.variable_changes[full_func_name].append((var_name, change_type, value))
+                if changed:
+                    if isinstance(value, mutable_types):
+                        value = value.copy()
+                    change_code = CHANGED if var_lifecycle else INITIALIZED
+                    var_lifecycle.append((CHANGE_TYPES[change_code], value))
+                    append_name(var_name)
+                    append_type(change_code)
+                    append_value(value)
 
     def _should_track_variable(self, full_func_name: str, class_name: Optional[str], var_name: str) -> bool:
         """
         Determine if a specific variable should be tracked.
 
+        Decisions are cached per `(full_func_name, class_name, var_name)` since
+        they only depend on the settings. Private variables are rejected before
+        the cache lookup so they never take up cache entries.
+
+        Args:
+            full_func_name: The fully qualified name of the function.
+            class_name: The name of the class, if applicable.
+            var_name: The name of the variable.
+
+        Returns:
+            True if the variable should be tracked; otherwise, False.
+        """
+        # Skip private variables (prefixed with `_`)
+        if var_name.startswith("_"):
+            return False
+
+        decision_key = (full_func_name, class_name, var_name)
+        decision = self._track_decision.get(decision_key)
+        if decision is None:
+            decision = self._should_track_variable_uncached(full_func_name, class_name, var_name)
+            self._track_decision[decision_key] = decision
+        return decision
+
+    def _should_track_variable_uncached(self, full_func_name: str, class_name: Optional[str],
+                                        var_name: str) -> bool:
+        """
+        Evaluate the tracking settings for a specific variable, without caching.
+
         Args:
             full_func_name: The fully qualified name of the function.
             class_name: The name of the class, if applicable.
@@ -139,13 +343,14 @@ class FunctionTracker(FunctionTrackerAbstract):
             True if the variable should be tracked; otherwise, False.
         """
         # Helper function to check wildcard or key-specific inclusion
-        def is_wildcard_or_contains(target_dict, key):
-            return key in target_dict and (target_dict[key] == "*" or var_name in target_dict[key])
+        def is_wildcard_or_contains(targets, key):
+            names = targets.get(key)
+            return names is WILDCARD or (names is not None and var_name in names)
 
         # Check if the variable meets the tracking conditions
-        return (
-            is_wildcard_or_contains(self.settings.track_functions, full_func_name) or
-            is_wildcard_or_contains(self.settings.track_classes, class_name) or
-            (class_name and not self.settings.track_classes) or 
-            not self.settings.track_functions
-        ) and not var_name.startswith("_")  # Skip private variables (prefixed with `_`)
+        return bool(
+            is_wildcard_or_contains(self._function_targets, full_func_name) or
+            is_wildcard_or_contains(self._class_targets, class_name) or
+            (class_name and self._all_class_variables) or
+            self._all_function_variables
+        )
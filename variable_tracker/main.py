@@ -1,50 +1,42 @@
-import sys
-
-from abc import ABC, abstractmethod
+import threading
+from typing import Protocol
 from .settings_loader import JsonSettingsLoader
 from .function_tracker import FunctionTracker
 from .printer import get_printer
 from .tracker import Tracker
 
-class SetupAbstract(ABC):
+class SetupAbstract(Protocol):
     """
-    Abstract base class defining the interface for initializing and managing a tracking system.
+    Protocol defining the interface for initializing and managing a tracking system.
     
     Defines the contract for setup and teardown operations in a tracking mechanism.
-    Subclasses must implement start() and stop() methods to define specific 
-    initialization and cleanup behaviors.
+    Implementations provide start() and stop() methods to define specific 
+    initialization and cleanup behaviors. Conformance is structural, so
+    implementations don't need to inherit from this class.
     """
 
-    @abstractmethod
     def start(self):
         """
-        Abstract method to initialize the tracking system.
+        Initialize the tracking system.
         
-        Subclasses must implement the logic for starting tracking,
+        Implementations provide the logic for starting tracking,
         setting up necessary components, and preparing the system.
-        
-        Raises:
-            NotImplementedError: If the method is not implemented by a subclass
         """
-        pass
+        ...
 
-    @abstractmethod
     def stop(self):
         """
-        Abstract method to stop the tracking system and perform cleanup.
+        Stop the tracking system and perform cleanup.
         
-        Subclasses must implement the logic for stopping tracking,
+        Implementations provide the logic for stopping tracking,
         releasing resources, and performing any necessary teardown operations.
-        
-        Raises:
-            NotImplementedError: If the method is not implemented by a subclass
         """
-        pass
+        ...
 
 
-class Setup(SetupAbstract):
+class Setup:
     """
-    Concrete implementation of the tracking system setup.
+    Concrete implementation of the tracking system setup (SetupAbstract protocol).
     
     Manages the initialization, configuration, and lifecycle of a tracking mechanism
     using a settings loader, function tracker, and custom printer.
@@ -65,6 +57,12 @@ class Setup(SetupAbstract):
         """
         self.settings_loader =  JsonSettingsLoader(settings_path)
         self.settings = {}
+        # The running tracker between start() and stop()
+        self.tracker = None
+        # Number of start() calls not matched by stop() yet, so overlapping
+        # users (such as concurrent requests) share the tracker
+        self._starts = 0
+        self._lock = threading.Lock()
 
     def start(self):
         """
@@ -75,33 +73,52 @@ class Setup(SetupAbstract):
         2. Create a function tracker based on the settings
         3. Create a printer for displaying tracking information
         4. Create a main tracker instance
-        5. Set up system-wide call tracing
+        5. Set up system-wide call tracing (see Tracker.start)
+
+        Calls while the tracker is already running only count the start, so
+        it keeps running until every start() has been matched by a stop().
         
         Raises:
             Exception: If any error occurs during tracker initialization
         """
-        try:
-            # Load configuration settings
-            self.settings = self.settings_loader.load_settings()
-            print("Tracker started with settings:", self.settings)
-            
-            # Create tracking components
-            function_tracker = FunctionTracker(self.settings)
-            printer = get_printer(self.settings)
-            tracker = Tracker(self.settings, function_tracker, printer)
-            
-            # Set up system-wide call tracing
-            sys.settrace(tracker._trace_calls)
-        except Exception as e:
-            print(f"Error starting tracker: {e}")
-            raise
+        with self._lock:
+            self._starts += 1
+            if self.tracker is not None:
+                return
+
+            try:
+                # Load configuration settings
+                self.settings = self.settings_loader.load_settings()
+                print("Tracker started with settings:", self.settings)
+                
+                # Create tracking components
+                function_tracker = FunctionTracker(self.settings)
+                printer = get_printer(self.settings)
+                tracker = Tracker(self.settings, function_tracker, printer)
+                
+                # Set up system-wide call tracing, including new threads
+                tracker.start()
+                self.tracker = tracker
+            except Exception as e:
+                self._starts -= 1
+                print(f"Error starting tracker: {e}")
+                raise
 
     def stop(self):
         """
         Stop the tracking system and disable call tracing.
         
         Disables the system-wide trace function, effectively stopping 
-        the tracking of function calls and related activities.
+        the tracking of function calls and related activities, once every
+        start() has been matched by a stop().
         """
-        print("Tracker stopped.")
-        sys.settrace(None)
\ No newline at end of file
+        with self._lock:
+            if self._starts == 0:
+                return
+            self._starts -= 1
+            if self._starts:
+                return
+
+            print("Tracker stopped.")
+            self.tracker.stop()
+            self.tracker = None
@@ -1,7 +1,20 @@
+import sys
 from dataclasses import dataclass
-from typing import Any, Dict
+from typing import Any, Dict, Optional
 
-@dataclass
+# Change types of a tracked variable. `variable_changes` stores the index
+# into CHANGE_TYPES rather than the label itself.
+INITIALIZED = 0
+CHANGED = 1
+CHANGE_TYPES = ("Initialized", "Changed")
+
+# Variable selection that tracks every variable of a function or class
+WILDCARD = "*"
+
+# Slotted dataclasses (faster attribute access, no per-instance __dict__) need Python 3.10+
+_DATACLASS_OPTIONS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+@dataclass(**_DATACLASS_OPTIONS)
 class SettingsData:
     """
     Represents configuration settings for variable lifecycle tracking.
@@ -12,12 +25,17 @@ class SettingsData:
         track_classes: Classes to track
         print_table: Whether to print changes in a table format
         print_lifecycle: Whether to print full variable lifecycle
+        max_history: Maximum number of lifecycle entries kept per variable,
+            or None for no limit
+        trace_generators: Whether to track generator and coroutine functions
     """
     module_path: str = 'python'
     track_functions: Dict[str, Any] = None
     track_classes: Dict[str, Any] = None
     print_table: bool = False
     print_lifecycle: bool = True
+    max_history: Optional[int] = 1024
+    trace_generators: bool = False
 
     def __post_init__(self):
         """
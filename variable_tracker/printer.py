@@ -1,52 +1,67 @@
-from abc import ABC, abstractmethod
-from .models import SettingsData
-from tabulate import tabulate
+from typing import Protocol
+from .models import SettingsData, CHANGE_TYPES
 
-class PrinterAbstract(ABC):
+class PrinterAbstract(Protocol):
     """
-    Abstract base class defining the interface for printing configuration or tracking data.
-    Subclasses must implement the print method to define specific printing strategies.
+    Protocol defining the interface for printing configuration or tracking data.
+    Printers provide the print method to define specific printing strategies;
+    conformance is structural, so they don't need to inherit from this class.
     """
-    @abstractmethod
     def print(self, data: dict, func_name: str):
         """
-        Abstract method to print data for a specific function.
+        Print data for a specific function.
         
         Args:
-            data (dict): A dictionary containing data to be printed
+            data (dict): A dictionary containing data to be printed; printers
+                read it without removing the entry, which is left to the caller
             func_name (str): The name of the function whose data is being printed
-        
-        Raises:
-            NotImplementedError: If the method is not implemented by a subclass
         """
-        pass
+        ...
 
 
-class TabluerPrinter(PrinterAbstract):
+class TabluerPrinter:
     """
     A printer implementation that displays data in a tabular format using the tabulate library.
     Prints changes to variables in a grid-like table.
+
+    tabulate is imported on the first print, so configurations that never
+    print tables don't pay for importing it.
     """
 
+    # tabulate.tabulate, loaded on first use
+    _tabulate = None
+
     def print(self, data: dict, func_name: str):
         """
         Print the data for a specific function in a tabular grid format.
         
         Args:
-            data (dict): A dictionary of function data
+            data (dict): A dictionary of function data, stored as "name", "type"
+                and "value" columns
             func_name (str): The name of the function being processed
         
         Prints:
             A formatted table showing variable changes using tabulate
         """
-        value = data.pop(func_name)
-        if value:
-            headers = ["Variable", "Change Type", "Value"]
-            print(f"\n-----------------Function '{func_name}' data-----------------")
-            print(tabulate(value, headers=headers, tablefmt="grid"))
+        value = data.get(func_name)
+        if not value or not value["name"]:
+            return
 
+        if TabluerPrinter._tabulate is None:
+            from tabulate import tabulate
+            TabluerPrinter._tabulate = staticmethod(tabulate)
 
-class LifeCyclePrinter(PrinterAbstract):
+        headers = ["Variable", "Change Type", "Value"]
+        rows = zip(
+            value["name"],
+            [CHANGE_TYPES[code] for code in value["type"]],
+            value["value"]
+        )
+        table = self._tabulate(list(rows), headers=headers, tablefmt="grid")
+        print(f"\n-----------------Function '{func_name}' data-----------------\n{table}")
+
+
+class LifeCyclePrinter:
     """
     A printer implementation that displays the full lifecycle of tracked variables 
     with a detailed, hierarchical print format.
@@ -61,14 +76,18 @@ class LifeCyclePrinter(PrinterAbstract):
             func_name (str): The name of the function being processed
         
         Prints:
-            A detailed representation of each variable's changes throughout its lifecycle
+            A detailed representation of each variable's changes throughout its lifecycle,
+            written with a single print call
         """
-        print(f"\n-----------------Function '{func_name}' Variable Lifecycles-----------------")
-        value = data.pop(func_name)
+        value = data.get(func_name)
+        if not value:
+            return
+
+        lines = [f"\n-----------------Function '{func_name}' Variable Lifecycles-----------------"]
         for var_name, lifecycle in value.items():
-            print(f"  Variable: {var_name}")
-            for change_type, value in lifecycle:
-                print(f"    - {change_type}: {value}")
+            lines.append(f"  Variable: {var_name}")
+            lines.extend(f"    - {change_type}: {change_value}" for change_type, change_value in lifecycle)
+        print("\n".join(lines))
 
 
 def get_printer(settings: SettingsData) -> PrinterAbstract:
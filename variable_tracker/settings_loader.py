@@ -1,42 +1,78 @@
-from abc import ABC, abstractmethod
+from copy import deepcopy
+from functools import lru_cache
 import json
-from typing import Dict, Any
+import os
+from typing import Dict, Any, Protocol
 from .models import SettingsData
 
-class SettingsLoader(ABC):
+try:
+    # Optional faster parser; orjson.JSONDecodeError subclasses json.JSONDecodeError
+    import orjson as _json
+except ImportError:
+    _json = json
+
+
+def _read_settings_file(path: str) -> Dict[str, Any]:
+    """
+    Read and parse a JSON settings file.
+
+    The file is read as bytes in one go and parsed with orjson when it is
+    installed, falling back to the standard json module.
+
+    Args:
+        path (str): Path to the JSON settings file.
+
+    Returns:
+        Dict[str, Any]: The raw settings dictionary.
+    """
+    with open(path, "rb") as f:
+        return _json.loads(f.read())
+
+
+@lru_cache(maxsize=32)
+def _load_cached(path: str, mtime_ns: int, size: int) -> Dict[str, Any]:
+    """
+    Memoized variant of `_read_settings_file`.
+
+    The file's modification time and size are part of the cache key, so an
+    edited settings file misses the cache and is parsed again. Parsing errors
+    are not cached and are raised on every call. The returned dict is shared
+    between calls and must not be modified; see `JsonSettingsLoader._read_settings`.
+    """
+    return _read_settings_file(path)
+
+
+class SettingsLoader(Protocol):
     """
-    Abstract base class defining the contract for loading configuration settings.
+    Protocol defining the contract for loading configuration settings.
 
     This class provides a standardized interface for loading configuration settings 
     from various sources. Concrete implementations will define specific loading 
-    mechanisms for different configuration formats or sources.
+    mechanisms for different configuration formats or sources. Conformance is
+    structural, so implementations don't need to inherit from this class.
 
     Attributes:
-        No direct attributes defined in the abstract base class.
+        No direct attributes defined in the protocol.
 
     Methods:
-        load_settings: Abstract method to load configuration settings.
+        load_settings: Load configuration settings.
     """
 
-    @abstractmethod
     def load_settings(self) -> Dict[str, Any]:
         """
-        Abstract method to load configuration settings from a source.
+        Load configuration settings from a source.
 
-        This method must be implemented by subclasses to provide a mechanism 
-        for loading configuration settings. The method should handle different 
-        loading scenarios, including potential errors and default configurations.
+        Implementations provide a mechanism for loading configuration
+        settings. The method should handle different loading scenarios,
+        including potential errors and default configurations.
 
         Returns:
             Dict[str, Any]: A dictionary containing configuration settings.
-
-        Raises:
-            NotImplementedError: If not implemented by a concrete subclass.
         """
-        pass
+        ...
 
 
-class JsonSettingsLoader(SettingsLoader):
+class JsonSettingsLoader:
     """
     Concrete implementation of settings loader for JSON configuration files.
 
@@ -48,6 +84,7 @@ class JsonSettingsLoader(SettingsLoader):
 
     Methods:
         load_settings: Load and validate settings from a JSON file.
+        _read_settings: Read the raw settings, reusing the cached parse.
         _validate_settings: Validate and sanitize loaded settings.
         _default_settings: Provide default settings if loading fails.
     """
@@ -84,14 +121,14 @@ class JsonSettingsLoader(SettingsLoader):
         Notes:
             - Prints error messages for loading/parsing failures
             - Fallback to default settings if an error occurs
+            - The parsed file is cached until its mtime or size changes
         """
         try:
             # Attempt to read and parse the JSON file
-            with open(self.settings_file, "r") as f:
-                settings = json.load(f)
-                
-                # Validate and sanitize the loaded settings
-                data = self._validate_settings(settings)
+            settings = self._read_settings()
+
+            # Validate and sanitize the loaded settings
+            data = self._validate_settings(settings)
         
         except (FileNotFoundError, json.JSONDecodeError) as e:
             # Handle potential loading or parsing errors
@@ -103,6 +140,26 @@ class JsonSettingsLoader(SettingsLoader):
         # Create and return a SettingsData object
         return SettingsData(**data)
 
+    def _read_settings(self) -> Dict[str, Any]:
+        """
+        Read the raw settings dictionary, reusing the cached parse when the
+        file has not changed since it was last loaded.
+
+        The cached parse is deep-copied, so changes to a loaded SettingsData
+        (including its nested track_functions and track_classes) don't leak
+        into later loads.
+
+        Returns:
+            Dict[str, Any]: The raw settings dictionary loaded from JSON.
+        """
+        try:
+            stat = os.stat(self.settings_file)
+        except OSError:
+            # Nothing to key the cache on; let the plain read report the error
+            return _read_settings_file(self.settings_file)
+
+        return deepcopy(_load_cached(self.settings_file, stat.st_mtime_ns, stat.st_size))
+
     def _validate_settings(self, settings: Dict[str, Any]) -> Dict[str, Any]:
         """
         Validate and sanitize the loaded settings dictionary.
@@ -110,6 +167,8 @@ class JsonSettingsLoader(SettingsLoader):
         This method performs the following validations:
         - Ensures all expected keys are present
         - Provides default values for missing keys
+        - Replaces a `max_history` that is not null or a positive integer
+          with the default of 1024, since deque(maxlen=...) rejects it
         - Allows for potential additional validation logic
 
         Args:
@@ -125,16 +184,28 @@ class JsonSettingsLoader(SettingsLoader):
                 'track_functions': {},
                 'track_classes': {},
                 'print_table': False,
-                'print_lifecycle': True
+                'print_lifecycle': True,
+                'max_history': 1024,
+                'trace_generators': False
             }
         """
+        max_history = settings.get('max_history', 1024)
+        # bool is an int subclass, but true/false is not a history length
+        if max_history is not None and (
+            type(max_history) is bool or not isinstance(max_history, int) or max_history <= 0
+        ):
+            print(f"Invalid max_history in {self.settings_file}: {max_history!r}; using 1024")
+            max_history = 1024
+
         return {
             # Use get() to provide default values, ensuring all keys exist
             'module_path': settings.get('module_path', 'python'),
             'track_functions': settings.get('track_functions', {}),
             'track_classes': settings.get('track_classes', {}),
             'print_table': settings.get('print_table', False),
-            'print_lifecycle': settings.get('print_lifecycle', True)
+            'print_lifecycle': settings.get('print_lifecycle', True),
+            'max_history': max_history,
+            'trace_generators': settings.get('trace_generators', False)
         }
 
     def _default_settings(self) -> Dict[str, Any]:
@@ -156,5 +227,7 @@ class JsonSettingsLoader(SettingsLoader):
             'track_functions': {},    # No functions tracked by default
             'track_classes': {},      # No classes tracked by default
             'print_table': False,     # Disable tabular output by default
-            'print_lifecycle': True   # Enable lifecycle printing by default
+            'print_lifecycle': True,  # Enable lifecycle printing by default
+            'max_history': 1024,      # Keep the latest 1024 changes per variable
+            'trace_generators': False # Skip generators and coroutines by default
         }
\ No newline at end of file
@@ -1,52 +1,136 @@
-from typing import Any, Optional
-from pathlib import Path
-from abc import ABC, abstractmethod
+import logging
+import re
+import sys
+import threading
+import weakref
+from functools import lru_cache, partial
+from typing import Any, Optional, Dict, Tuple, Protocol
 
 from .models import SettingsData
 from .function_tracker import FunctionTracker
 from .printer import PrinterAbstract
 
-class TrackerAbstract(ABC):
+logger = logging.getLogger(__name__)
+
+# sys.monitoring (PEP 669) tool name used on Python 3.12+
+_MONITORING_TOOL_NAME = "variable_tracker"
+# sys.monitoring tool ids (0-5) reserved for debuggers, coverage, profilers and
+# optimizers; the tracker claims one of the others
+_RESERVED_TOOL_IDS = ("DEBUGGER_ID", "COVERAGE_ID", "PROFILER_ID", "OPTIMIZER_ID")
+_TOOL_ID_COUNT = 6
+
+# CO_GENERATOR | CO_COROUTINE | CO_ASYNC_GENERATOR
+_GENERATOR_FLAGS = 0x20 | 0x100 | 0x200
+
+# Outcomes of Tracker._track_frame
+_TRACKED = 0        # The frame's variables are tracked
+_NOT_TRACKED = 1    # The frame isn't tracked, but other frames of its code may be
+_CODE_SKIPPED = 2   # No frame of the code is tracked
+_CODE_EXCLUDED = 3  # Framework or library code whose sys.monitoring events are disabled
+
+# Tracker._code_cache entry: (outcome, file_name, module_name, func_name, full_func_names)
+_CodeInfo = Tuple[int, str, str, str, Optional[Dict[Optional[str], str]]]
+
+
+@lru_cache(maxsize=None)
+def _free_tool_id_restores_events(tool_id: int) -> bool:
+    """
+    Check whether freeing a sys.monitoring tool id re-enables disabled events.
+
+    Events a callback disabled with sys.monitoring.DISABLE stay disabled for
+    the tool id on Python 3.12 and 3.13, even after free_tool_id(), and the
+    next tool using the id would inherit them. This is probed once, with a
+    throwaway function, rather than assumed from the version.
+
+    Args:
+        tool_id (int): A tool id that is currently free.
+
+    Returns:
+        bool: True if a start event disabled before free_tool_id() is
+        reported again once the id is reused.
+    """
+    monitoring = sys.monitoring
+    events = monitoring.events
+    reported = []
+
+    def probe():
+        pass
+
+    def on_start(code, instruction_offset):
+        if code is probe.__code__:
+            reported.append(code)
+            return monitoring.DISABLE
+        return None
+
+    for _ in range(2):
+        monitoring.use_tool_id(tool_id, _MONITORING_TOOL_NAME)
+        try:
+            monitoring.register_callback(tool_id, events.PY_START, on_start)
+            monitoring.set_events(tool_id, events.PY_START)
+            probe()
+        finally:
+            monitoring.set_events(tool_id, events.NO_EVENTS)
+            monitoring.register_callback(tool_id, events.PY_START, None)
+            monitoring.free_tool_id(tool_id)
+    return len(reported) == 2
+
+
+def _file_stem(filename: str) -> str:
     """
-    Abstract base class defining the contract for variable tracking functionality.
+    Return the final path component of a filename without its extension.
+
+    Equivalent to `Path(filename).stem`, but handles both path separators
+    and doesn't construct a Path object.
+
+    Args:
+        filename (str): The filename from a code object.
+
+    Returns:
+        str: The file name without directory and extension.
+    """
+    slash = max(filename.rfind("/"), filename.rfind("\\"))
+    name = filename[slash + 1:]
+    dot = name.rfind(".")
+    # A leading dot (".hidden") is part of the name, not an extension
+    return name[:dot] if dot > 0 else name
+
+
+class TrackerAbstract(Protocol):
+    """
+    Protocol defining the contract for variable tracking functionality.
     
-    This class provides an abstract interface for tracking function calls, 
-    extracting class names, and managing the tracing process. Concrete 
-    implementations must provide specific tracking mechanisms.
+    This class describes the interface for tracking function calls, 
+    extracting class names, and managing the tracing process. Conformance
+    is structural, so implementations don't need to inherit from this class.
 
     Attributes:
-        No direct attributes defined in the abstract base class.
+        No direct attributes defined in the protocol.
 
     Methods:
-        _trace_calls: Abstract method to trace function calls and variable changes.
-        _get_class_name: Abstract method to extract the class name from a stack frame.
+        _trace_calls: Traces function calls and variable changes.
+        _get_class_name: Extracts the class name from a stack frame.
     """
 
-    @abstractmethod
     def _trace_calls(self, frame: Any, event: str, arg: Any) -> Any:
         """
-        Abstract method to trace function calls and manage variable tracking.
+        Trace function calls and manage variable tracking.
 
-        This method is called for each function call during tracing and should 
-        implement the core logic of tracking variable lifecycles.
+        This method is called for each function call during tracing and 
+        implements the core logic of tracking variable lifecycles.
 
         Args:
             frame (Any): The current stack frame being traced.
-            event (str): The type of event ('call', 'line', 'return', etc.).
+            event (str): The type of event ('call', 'return', 'c_call', etc.).
             arg (Any): Additional event-specific argument.
 
         Returns:
             Any: Typically returns itself to continue tracing, or None to stop.
-
-        Raises:
-            NotImplementedError: If not implemented by a concrete subclass.
         """
-        pass
+        ...
 
-    @abstractmethod
     def _get_class_name(self, frame: Any) -> Optional[str]:
         """
-        Abstract method to extract the class name from a stack frame.
+        Extract the class name from a stack frame.
 
         Determines the name of the class containing the current method being executed.
 
@@ -55,16 +139,13 @@ class TrackerAbstract(ABC):
 
         Returns:
             Optional[str]: The name of the class, or None if not inside a class method.
-
-        Raises:
-            NotImplementedError: If not implemented by a concrete subclass.
         """
-        pass
+        ...
 
 
-class Tracker(TrackerAbstract):
+class Tracker:
     """
-    Concrete implementation of the TrackerAbstract class for tracking function calls 
+    Concrete implementation of the TrackerAbstract protocol for tracking function calls 
     and managing variable lifecycles within the code. It leverages the settings, 
     function tracking, and printer to provide optimized trace functionality.
 
@@ -75,9 +156,18 @@ class Tracker(TrackerAbstract):
         skip_paths (list): Paths to skip during tracing (e.g., Django and other frameworks).
     
     Methods:
+        start, stop: Install and uninstall the tracker.
+        _settrace: Installs or removes the trace hook for all threads.
         _should_skip_frame: Determines if the current stack frame should be skipped.
         _get_class_name: Extracts the class name from the given stack frame.
+        _get_code_info: Returns the cached classification of a frame's code object.
+        _forget_code: Drops the classification of a freed code object.
         _trace_calls: Main method to trace function calls and variable changes.
+        _report_error: Logs a tracking error once per function.
+        _emit_changes, _emit_lifecycle: Print a returning function's data.
+        _monitor_call, _monitor_line, _monitor_return, _monitor_unwind: sys.monitoring callbacks.
+        _enable_line_events: Turns on sys.monitoring line events for tracked code.
+        _track_frame: Tracks the variables of a called or returning frame.
     """
     
     def __init__(
@@ -97,6 +187,13 @@ class Tracker(TrackerAbstract):
         self.settings = settings
         self.function_tracker = function_tracker
         self.printer = printer
+        # Bound once; print_table doesn't change during a tracing session, so the
+        # output to print on return is chosen here rather than on every return
+        self._printer_print = printer.print
+        self._emit = self._emit_changes if settings.print_table else self._emit_lifecycle
+        # Cached to avoid the two-level attribute lookup when classifying frames
+        self._module_path = settings.module_path
+        self._trace_generators = settings.trace_generators
         # Paths to skip when tracing, such as Django and third-party libraries
         self.skip_paths = [
             'django',
@@ -110,34 +207,297 @@ class Tracker(TrackerAbstract):
             'lib/python',
             '/usr/lib/python'
         ]
+        # All skip paths fused into one pattern, so a filename is scanned once
+        self._skip_re = re.compile("|".join(re.escape(path) for path in self.skip_paths))
+        # Filenames already classified by _should_skip_frame
+        self._accepted_files = set()
+        self._rejected_files = set()
+        # Django internal methods related to dispatching, middleware, or response
+        self._django_skip_re = re.compile(r"dispatch|middleware|get_response")
+        # Functions whose tracking errors have already been logged
+        self._reported_errors = set()
+        # Bound once; accessing self._trace_calls creates a new bound method each time
+        self._trace_self = self._trace_calls
+        # Set by stop(), and cleared again by start()
+        self._stopped = False
+        # Whether the hooks installed by start() are in place
+        self._running = False
+        # sys.monitoring tool id while monitoring is active, otherwise None
+        self._monitoring_tool_id = None
+        # Whether sys.monitoring events of excluded code may be disabled for good
+        self._disable_excluded = False
+        # Code objects whose sys.monitoring line events were turned on
+        self._line_codes = weakref.WeakSet()
+        # (skip, file_name, module_name, func_name, full_func_names) per id(frame.f_code),
+        # where full_func_names maps class names to resolved tracking keys
+        self._code_cache: Dict[int, _CodeInfo] = {}
+        # Weak references that drop a code object's entry once it is freed; they
+        # belong to this tracker, so nothing outlives it
+        self._code_refs: Dict[int, weakref.ref] = {}
+
+    def start(self) -> None:
+        """
+        Install the tracker for all threads.
+
+        On Python 3.12+ the tracker registers sys.monitoring callbacks for
+        function start and return events, and turns on line events for each
+        tracked code object only. Where freeing the tool id undoes it, start
+        and return events are disabled for framework and library code, so it
+        stops paying for the callback after its first call; elsewhere the code
+        cache answers for it. Older versions (or when no unreserved tool id is
+        free) fall back to a trace hook (sys.settrace). Variables are sampled
+        on every line of a tracked frame, since that is how values changing
+        within a function are recorded; untracked frames get no local trace
+        function and therefore no line events.
+
+        sys.monitoring applies to the whole process, so on Python 3.12+ every
+        thread is traced, including threads that are already running. The
+        sys.settrace hook covers the calling thread and threads started
+        later, and running threads too where threading.settrace_all_threads
+        exists (Python 3.12+).
+
+        Raises:
+            RuntimeError: If the tracker has already been started.
+        """
+        if self._running:
+            raise RuntimeError("Tracker is already started")
+        self._running = True
+        self._stopped = False
+        if not self._start_monitoring():
+            self._settrace(self._trace_self)
+
+    def stop(self) -> None:
+        """
+        Uninstall the tracker installed by start().
+
+        Before Python 3.12 a thread started while tracking keeps the trace
+        hook after stop(); the hook checks the tracker's stopped flag, so such
+        threads stop being tracked as well.
+        """
+        if not self._running:
+            return
+        self._running = False
+        self._stopped = True
+        if self._monitoring_tool_id is not None:
+            self._stop_monitoring()
+        else:
+            self._settrace(None)
+
+    @staticmethod
+    def _settrace(trace_function: Any) -> None:
+        """
+        Install or remove a trace hook for the current thread and new threads.
+
+        Uses threading.settrace_all_threads (Python 3.12+) where it exists,
+        which also covers threads that are already running.
+
+        Args:
+            trace_function (Any): The trace function, or None to remove it.
+        """
+        settrace_all_threads = getattr(threading, "settrace_all_threads", None)
+        if settrace_all_threads is not None:
+            settrace_all_threads(trace_function)
+        else:
+            threading.settrace(trace_function)
+            sys.settrace(trace_function)
+
+    def _start_monitoring(self) -> bool:
+        """
+        Register the tracker's callbacks with sys.monitoring (Python 3.12+).
+
+        The tracker claims a free tool id outside the ones reserved for
+        debuggers, coverage, profilers and optimizers, so it never competes
+        with tools such as cProfile for their id.
+
+        Returns:
+            bool: True if monitoring is active, False if it is unavailable or
+            no unreserved tool id is free.
+        """
+        monitoring = getattr(sys, "monitoring", None)
+        if monitoring is None:
+            return False
+
+        reserved = {getattr(monitoring, name) for name in _RESERVED_TOOL_IDS}
+        for tool_id in range(_TOOL_ID_COUNT):
+            if tool_id in reserved or monitoring.get_tool(tool_id) is not None:
+                continue
+            try:
+                # Only disable events where freeing the id undoes it again
+                self._disable_excluded = _free_tool_id_restores_events(tool_id)
+                monitoring.use_tool_id(tool_id, _MONITORING_TOOL_NAME)
+            except ValueError:
+                # Another tool claimed the id in the meantime
+                continue
+            break
+        else:
+            return False
+
+        events = monitoring.events
+        monitoring.register_callback(tool_id, events.PY_START, self._monitor_call)
+        monitoring.register_callback(tool_id, events.PY_RETURN, self._monitor_return)
+        monitoring.register_callback(tool_id, events.PY_UNWIND, self._monitor_unwind)
+        monitoring.register_callback(tool_id, events.LINE, self._monitor_line)
+        event_set = events.PY_START | events.PY_RETURN | events.PY_UNWIND
+        if self._trace_generators:
+            # sys.settrace reports a yield as a return and a resumption as a
+            # call, so generators are printed at every yield on both backends
+            monitoring.register_callback(tool_id, events.PY_YIELD, self._monitor_return)
+            monitoring.register_callback(tool_id, events.PY_RESUME, self._monitor_call)
+            event_set |= events.PY_YIELD | events.PY_RESUME
+        monitoring.set_events(tool_id, event_set)
+        self._monitoring_tool_id = tool_id
+        return True
+
+    def _stop_monitoring(self):
+        """
+        Unregister the tracker's sys.monitoring callbacks and free the tool id.
+        """
+        monitoring = sys.monitoring
+        tool_id = self._monitoring_tool_id
+        events = monitoring.events
+        monitoring.set_events(tool_id, events.NO_EVENTS)
+        for code in list(self._line_codes):
+            monitoring.set_local_events(tool_id, code, events.NO_EVENTS)
+        self._line_codes.clear()
+        for event in (events.PY_START, events.PY_RETURN, events.PY_UNWIND, events.LINE,
+                      events.PY_YIELD, events.PY_RESUME):
+            monitoring.register_callback(tool_id, event, None)
+        monitoring.free_tool_id(tool_id)
+        self._monitoring_tool_id = None
+
+    def _report_error(self, full_func_name: str, error: Exception) -> None:
+        """
+        Log an error raised while tracking a function, once per function.
+
+        A function that keeps failing would otherwise report the same error on
+        every call and flood the output.
+
+        Args:
+            full_func_name (str): The tracking key of the failing function.
+            error (Exception): The error that was raised.
+        """
+        if full_func_name in self._reported_errors:
+            return
+        self._reported_errors.add(full_func_name)
+        logger.warning("Error in variable tracking for '%s': %s", full_func_name, error)
+
+    def _emit_changes(self, full_func_name: str) -> None:
+        """
+        Print the variable changes of a returning function (print_table).
+
+        Args:
+            full_func_name (str): The tracking key of the returning function.
+        """
+        output = self.function_tracker.variable_changes
+        self._printer_print(output, full_func_name)
+        # Printers leave the data in place; drop it once it has been emitted
+        output.pop(full_func_name, None)
+
+    def _emit_lifecycle(self, full_func_name: str) -> None:
+        """
+        Print the variable lifecycles of a returning function.
+
+        Args:
+            full_func_name (str): The tracking key of the returning function.
+        """
+        output = self.function_tracker.variable_lifecycle
+        self._printer_print(output, full_func_name)
+        # Printers leave the data in place; drop it once it has been emitted
+        output.pop(full_func_name, None)
 
     def _should_skip_frame(self, filename: str) -> bool:
         """
         Determine if the current frame should be skipped based on its filename.
 
+        Each filename is classified once; code objects share their (interned)
+        co_filename, so later code objects from the same file only pay a set lookup.
+
         Args:
             filename (str): The filename from the frame.
         
         Returns:
             bool: True if the frame should be skipped, otherwise False.
         """
-        # Skip if the filename is outside the module's path
-        if not self.settings.module_path in filename:
+        if filename in self._rejected_files:
             return True
-            
-        # Skip framework-related files such as Django or third-party libraries
-        return any(path in filename for path in self.skip_paths)
+        if filename in self._accepted_files:
+            return False
+
+        # Skip if the filename is outside the module's path, or if it belongs to
+        # framework-related files such as Django or third-party libraries
+        skip = self._module_path not in filename or self._skip_re.search(filename) is not None
+        (self._rejected_files if skip else self._accepted_files).add(filename)
+        return skip
 
     def _get_class_name(self, frame: Any) -> Optional[str]:
         """Extract the class name from a stack frame."""
-        if "self" not in frame.f_locals:
-            return None
-            
-        try:
-            return frame.f_locals["self"].__class__.__name__
-        except (AttributeError, KeyError):
-            return None
+        # f_locals is materialized on every access, so read it only once
+        self_obj = frame.f_locals.get("self")
+        return type(self_obj).__name__ if self_obj is not None else None
     
+    def _get_code_info(self, frame: Any) -> _CodeInfo:
+        """
+        Classify the code object of a frame, reusing the result for later calls.
+
+        Everything here only depends on the code object, so it is computed
+        once per code object and dropped again when the code object is freed.
+
+        Args:
+            frame (Any): The current stack frame.
+
+        Returns:
+            Tuple: _CODE_EXCLUDED for framework and library code, _CODE_SKIPPED
+            for other code that is never tracked, or else _TRACKED, followed by
+            its file name (without extension), module name, function name and,
+            for code that may be tracked, the dict that caches its resolved
+            tracking key per class name.
+        """
+        code = frame.f_code
+        code_id = id(code)
+        info = self._code_cache.get(code_id)
+        if info is not None:
+            return info
+
+        filename = code.co_filename
+        func_name = code.co_name
+        if self._should_skip_frame(filename):
+            info = (_CODE_SKIPPED, "", "", func_name, None)
+            # Excluded code is only told apart to disable its sys.monitoring events:
+            # framework and library files are skipped whatever the settings, while
+            # other files are only outside this tracker's module path
+            if self._disable_excluded and self._skip_re.search(filename) is not None:
+                info = (_CODE_EXCLUDED, "", "", func_name, None)
+        # Skip Django internal methods related to dispatching, middleware, or response
+        elif self._django_skip_re.search(func_name) is not None:
+            info = (_CODE_EXCLUDED if self._disable_excluded else _CODE_SKIPPED, "", "", func_name, None)
+        # Generator and coroutine frames report a call and a return on every
+        # resume and yield, so skip them unless asked to trace them
+        elif not self._trace_generators and code.co_flags & _GENERATOR_FLAGS:
+            info = (_CODE_SKIPPED, "", "", func_name, None)
+        else:
+            module_name = frame.f_globals.get("__name__", "")
+            info = (_TRACKED, _file_stem(filename), module_name, func_name, {})
+
+        try:
+            # Forget the entry with the code object, so its id can't be reused stale
+            self._code_refs[code_id] = weakref.ref(code, partial(self._forget_code, code_id))
+        except TypeError:
+            # A reused id couldn't be detected, so don't cache the result
+            return info
+        self._code_cache[code_id] = info
+        return info
+
+    def _forget_code(self, code_id: int, ref: Any = None) -> None:
+        """
+        Drop the cached classification of a freed code object.
+
+        Args:
+            code_id (int): The id of the freed code object.
+            ref (Any): The weak reference whose callback this is.
+        """
+        self._code_cache.pop(code_id, None)
+        self._code_refs.pop(code_id, None)
+
     def _trace_calls(self, frame: Any, event: str, arg: Any) -> Any:
         """
         Trace function calls with Django-specific optimizations. It is the main 
@@ -149,51 +509,149 @@ class Tracker(TrackerAbstract):
             arg (Any): Additional event-specific argument.
         
         Returns:
-            Any: Returns self to continue tracing the next frame.
+            Any: Returns self to keep tracing the lines of a tracked frame, or
+            None for untracked frames, which stops their local tracing.
         """
-        try:
-            # Get filename from the stack frame
-            filename = frame.f_code.co_filename
+        # Threads keep the hook of a stopped tracker until they exit
+        if self._stopped or self._track_frame(frame, event) != _TRACKED:
+            return None
 
-            # Skip processing if the frame should be skipped
-            if self._should_skip_frame(filename):
-                return self._trace_calls
+        # Return self to continue tracing the frame
+        return self._trace_self
 
-            # Extract context information like function, class, and module name
-            file_name = Path(filename).stem
-            module_name = frame.f_globals.get("__name__", "")
-            func_name = frame.f_code.co_name
-            class_name = self._get_class_name(frame)
+    def _monitor_call(self, code: Any, instruction_offset: int) -> Any:
+        """
+        sys.monitoring PY_START callback (Python 3.12+), and PY_RESUME callback
+        when generators are traced.
+
+        Args:
+            code (Any): The code object that started executing.
+            instruction_offset (int): The offset of the starting instruction.
+
+        Returns:
+            Any: sys.monitoring.DISABLE for framework and library code, so the
+            interpreter stops reporting it, where freeing the tool id re-enables
+            it again; otherwise None.
+        """
+        result = self._track_frame(sys._getframe(1), "call")
+        if result == _TRACKED:
+            self._enable_line_events(code)
+        elif result == _CODE_EXCLUDED:
+            # Only code that no settings would track is disabled, and only where
+            # freeing the tool id undoes it (see _free_tool_id_restores_events)
+            return sys.monitoring.DISABLE
+        return None
 
-            # Skip Django internal methods related to dispatching, middleware, or response
-            if any(name in func_name for name in ['dispatch', 'middleware', 'get_response']):
-                return self._trace_calls
+    def _monitor_line(self, code: Any, line_number: int) -> None:
+        """
+        sys.monitoring LINE callback (Python 3.12+), for tracked code only.
+
+        Args:
+            code (Any): The code object being executed.
+            line_number (int): The line about to be executed.
+        """
+        self._track_frame(sys._getframe(1), "line")
+
+    def _monitor_return(self, code: Any, instruction_offset: int, retval: Any) -> Any:
+        """
+        sys.monitoring PY_RETURN callback (Python 3.12+), and PY_YIELD callback
+        when generators are traced.
+
+        Args:
+            code (Any): The code object that is returning.
+            instruction_offset (int): The offset of the return or yield instruction.
+            retval (Any): The value being returned or yielded.
+
+        Returns:
+            Any: sys.monitoring.DISABLE for framework and library code, so the
+            interpreter stops reporting it, where freeing the tool id re-enables
+            it again; otherwise None.
+        """
+        if self._track_frame(sys._getframe(1), "return") == _CODE_EXCLUDED:
+            return sys.monitoring.DISABLE
+        return None
+
+    def _enable_line_events(self, code: Any) -> None:
+        """
+        Turn on sys.monitoring line events for a tracked code object.
+
+        Line events are enabled per code object rather than globally, so only
+        tracked code pays for a callback on every line.
+
+        Args:
+            code (Any): The code object of a tracked frame.
+        """
+        monitoring = sys.monitoring
+        tool_id = self._monitoring_tool_id
+        if not monitoring.get_local_events(tool_id, code):
+            monitoring.set_local_events(tool_id, code, monitoring.events.LINE)
+            self._line_codes.add(code)
+
+    def _monitor_unwind(self, code: Any, instruction_offset: int, exception: BaseException) -> None:
+        """
+        sys.monitoring PY_UNWIND callback (Python 3.12+).
+
+        Treats a function exiting with an exception as a return, like the
+        'return' event of sys.settrace. Unwind events cannot be disabled.
+
+        Args:
+            code (Any): The code object being exited.
+            instruction_offset (int): The offset of the raising instruction.
+            exception (BaseException): The exception being propagated.
+        """
+        self._track_frame(sys._getframe(1), "return")
+
+    def _track_frame(self, frame: Any, event: str) -> int:
+        """
+        Track the variables of a frame, printing them when the frame returns.
+
+        Args:
+            frame (Any): The stack frame being traced.
+            event (str): The trace event, such as 'call', 'line' or 'return'.
 
-            # Get the fully qualified function name using function tracker
-            full_func_name = self.function_tracker._get_function_full_name(
+        Returns:
+            int: _TRACKED if the frame is tracked, _CODE_SKIPPED or _CODE_EXCLUDED
+            if its code can never be tracked, independently of the instance it
+            runs on, and _NOT_TRACKED otherwise.
+        """
+        # Reject skipped code before anything else; nearly all frames in a
+        # framework process are library frames that end here
+        info = self._code_cache.get(id(frame.f_code))
+        if info is None:
+            info = self._get_code_info(frame)
+        if info[0]:
+            return info[0]
+
+        _, file_name, module_name, func_name, full_func_names = info
+
+        # Extract the class name, which depends on the running instance; this is
+        # _get_class_name inlined, reading f_locals only once
+        self_obj = frame.f_locals.get("self")
+        class_name = type(self_obj).__name__ if self_obj is not None else None
+
+        # Get the fully qualified function name using function tracker, once per
+        # code object and class name
+        full_func_name = full_func_names.get(class_name)
+        if full_func_name is None:
+            full_func_name = full_func_names[class_name] = self.function_tracker._get_function_full_name(
                 module_name, file_name, func_name, class_name
             )
-            
-            if full_func_name:
+
+        if full_func_name:
+            # Only sampling and printing touch user values, whose comparison, len()
+            # or repr() may raise anything; none of it may reach the traced program
+            try:
                 # Track the variables within the function call
                 self.function_tracker._trace_function_variables(frame, full_func_name, class_name)
-                
+
                 # Print the changes in the function's variables when it returns
                 if event == "return":
-                    if self.settings.print_table:
-                        self.printer.print(
-                            self.function_tracker.variable_changes, 
-                            full_func_name
-                        )
-                    else:
-                        self.printer.print(
-                            self.function_tracker.variable_lifecycle, 
-                            full_func_name
-                        )
-        
-        except Exception as e:
-            # Catch any exceptions that occur during tracing
-            print(f"Error in variable tracking: {str(e)}")
-            
-        # Return self to continue tracing further frames
-        return self._trace_calls
+                    self._emit(full_func_name)
+            except Exception as e:
+                self._report_error(full_func_name, e)
+            return _TRACKED
+
+        if class_name is None:
+            # Without a class name the match only depends on the code object
+            return _CODE_SKIPPED
+        return _NOT_TRACKED